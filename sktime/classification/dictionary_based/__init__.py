@@ -10,12 +10,32 @@ __all__ = [
     "MUSE",
 ]
 
-from sktime.classification.dictionary_based._boss import BOSSEnsemble, IndividualBOSS
-from sktime.classification.dictionary_based._boss_pyts import BOSSVSClassifierPyts
-from sktime.classification.dictionary_based._cboss import ContractableBOSS
-from sktime.classification.dictionary_based._muse import MUSE
-from sktime.classification.dictionary_based._tde import (
-    IndividualTDE,
-    TemporalDictionaryEnsemble,
-)
-from sktime.classification.dictionary_based._weasel import WEASEL
+# lazy submodule map (PEP 562), importing one classifier does not pull in
+# the heavy dependencies (numba, pyts) of its siblings
+_lazy_imports = {
+    "IndividualBOSS": "._boss",
+    "BOSSEnsemble": "._boss",
+    "BOSSVSClassifierPyts": "._boss_pyts",
+    "ContractableBOSS": "._cboss",
+    "MUSE": "._muse",
+    "IndividualTDE": "._tde",
+    "TemporalDictionaryEnsemble": "._tde",
+    "WEASEL": "._weasel",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first attribute access."""
+    if name in _lazy_imports:
+        from importlib import import_module
+
+        module = import_module(_lazy_imports[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List module attributes including lazily imported classifiers."""
+    return sorted(set(globals()) | set(__all__))
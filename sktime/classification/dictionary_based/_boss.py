@@ -19,6 +19,7 @@ from sklearn.utils.sparsefuncs_fast import csr_row_norms
 from sklearn.utils.validation import _num_samples
 
 from sktime.classification.base import BaseClassifier
+from sktime.classification.dictionary_based._utils import _predict_proba_ensemble
 from sktime.transformations.panel.dictionary_based import SFAFast
 from sktime.utils.dependencies import _check_soft_dependencies
 from sktime.utils.validation.panel import check_X_y
@@ -327,12 +328,13 @@ class BOSSEnsemble(BaseClassifier):
         y : array-like, shape = [n_instances, n_classes_]
             Predicted probabilities using the ordering in classes_.
         """
-        sums = np.zeros((X.shape[0], self.n_classes_))
-
-        for clf in self.estimators_:
-            preds = clf.predict(X)
-            for i in range(0, X.shape[0]):
-                sums[i, self._class_dictionary[preds[i]]] += 1
+        sums = _predict_proba_ensemble(
+            self.estimators_,
+            X,
+            self._class_dictionary,
+            self.n_classes_,
+            n_jobs=self._threads_to_use,
+        )
         dists = sums / (np.ones(self.n_classes_) * self.n_estimators_)
 
         return dists
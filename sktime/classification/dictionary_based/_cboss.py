@@ -17,6 +17,7 @@ from sklearn.utils import check_random_state
 from sktime.classification.base import BaseClassifier
 from sktime.classification.dictionary_based import IndividualBOSS
 from sktime.classification.dictionary_based._boss import pairwise_distances
+from sktime.classification.dictionary_based._utils import _predict_proba_ensemble
 from sktime.utils.validation.panel import check_X_y
 
 
@@ -339,13 +340,14 @@ class ContractableBOSS(BaseClassifier):
         y : array-like, shape = [n_instances, n_classes_]
             Predicted probabilities using the ordering in classes_.
         """
-        sums = np.zeros((X.shape[0], self.n_classes_))
-
-        for n, clf in enumerate(self.estimators_):
-            preds = clf.predict(X)
-            for i in range(0, X.shape[0]):
-                sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
-
+        sums = _predict_proba_ensemble(
+            self.estimators_,
+            X,
+            self._class_dictionary,
+            self.n_classes_,
+            n_jobs=self._threads_to_use,
+            weights=self.weights_,
+        )
         dists = sums / (np.ones(self.n_classes_) * self._weight_sum)
 
         return dists
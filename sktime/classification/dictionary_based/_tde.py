@@ -18,6 +18,7 @@ from sklearn.kernel_ridge import KernelRidge
 from sklearn.utils import check_random_state
 
 from sktime.classification.base import BaseClassifier
+from sktime.classification.dictionary_based._utils import _predict_proba_ensemble
 from sktime.transformations.panel.dictionary_based import SFA
 from sktime.utils.validation.panel import check_X_y
 from sktime.utils.warnings import warn
@@ -415,12 +416,14 @@ class TemporalDictionaryEnsemble(BaseClassifier):
                 "that in the test data"
             )
 
-        sums = np.zeros((X.shape[0], self.n_classes_))
-
-        for n, clf in enumerate(self.estimators_):
-            preds = clf.predict(X)
-            for i in range(0, X.shape[0]):
-                sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
+        sums = _predict_proba_ensemble(
+            self.estimators_,
+            X,
+            self._class_dictionary,
+            self.n_classes_,
+            n_jobs=self._threads_to_use,
+            weights=self.weights_,
+        )
 
         return sums / (np.ones(self.n_classes_) * self._weight_sum)
 
@@ -0,0 +1,48 @@
+"""Shared helpers for dictionary based ensemble classifiers."""
+
+__all__ = ["_predict_proba_ensemble"]
+
+import numpy as np
+from joblib import Parallel, delayed
+
+
+def _predict_proba_ensemble(
+    estimators, X, class_dictionary, n_classes, n_jobs=1, weights=None
+):
+    """Accumulate weighted class votes of independent ensemble members.
+
+    Member predictions do not depend on each other, so they are dispatched
+    concurrently via joblib with the threading backend preference, which
+    shares X between workers instead of copying it.
+
+    Parameters
+    ----------
+    estimators : list
+        Fitted ensemble member classifiers to poll.
+    X : 3D np.array of shape = [n_instances, n_dimensions, series_length]
+        The data to make predict probabilities for.
+    class_dictionary : dict
+        Mapping from class label to column index in the output.
+    n_classes : int
+        Number of classes, i.e., number of columns of the output.
+    n_jobs : int, default=1
+        Number of jobs to run the member predictions in parallel.
+    weights : list of float or None, default=None
+        Vote weight per ensemble member, 1 for each member if None.
+
+    Returns
+    -------
+    sums : 2D np.array of shape = [n_instances, n_classes]
+        Weighted class vote counts, not yet normalized.
+    """
+    all_preds = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(clf.predict)(X) for clf in estimators
+    )
+
+    sums = np.zeros((X.shape[0], n_classes))
+    for n, preds in enumerate(all_preds):
+        weight = 1 if weights is None else weights[n]
+        for i in range(0, X.shape[0]):
+            sums[i, class_dictionary[preds[i]]] += weight
+
+    return sums
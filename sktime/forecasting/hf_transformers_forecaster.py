@@ -57,6 +57,12 @@ class HFTransformersForecaster(BaseForecaster):
         Whether the predictions should be deterministic or not.
     callbacks : list, default=[]
         List of callbacks to use during training. See `transformers.Trainer`
+    precision : str or None, default="high"
+        Float32 matmul precision, passed to
+        ``torch.set_float32_matmul_precision`` before training and
+        prediction. One of ``"highest"``, ``"high"``, ``"medium"``, or None
+        to leave the torch default untouched. On Ampere or newer GPUs,
+        ``"high"`` enables TF32 tensor core matmuls.
 
     Examples
     --------
@@ -109,6 +115,7 @@ class HFTransformersForecaster(BaseForecaster):
         compute_metrics=None,
         deterministic=False,
         callbacks=None,
+        precision="high",
     ):
         super().__init__()
         self.model_path = model_path
@@ -124,8 +131,12 @@ class HFTransformersForecaster(BaseForecaster):
         self.deterministic = deterministic
         self.callbacks = callbacks
         self._callbacks = callbacks
+        self.precision = precision
 
     def _fit(self, y, X, fh):
+        if self.precision is not None:
+            torch.set_float32_matmul_precision(self.precision)
+
         # Load model and extract config
         config = AutoConfig.from_pretrained(self.model_path)
 
@@ -177,19 +188,30 @@ class HFTransformersForecaster(BaseForecaster):
         for param in self.model.parameters():
             param.requires_grad = False
 
-        # Clamp all loaded parameters to avoid NaNs due to large values
-        for param in self.model.model.parameters():
-            param.clamp_(-1000, 1000)
-
-        # Reininit the weights of all layers that have mismatched sizes
-        for key, _, _ in info["mismatched_keys"]:
-            _model = self.model
-            for attr_name in key.split(".")[:-1]:
-                _model = getattr(_model, attr_name)
-            _model.weight = torch.nn.Parameter(
-                _model.weight.masked_fill(_model.weight.isnan(), 0.001),
-                requires_grad=True,
-            )
+        # Clamping and reinit are only needed if some weights did not load
+        # cleanly, skip the full pass over the model weights otherwise
+        if info["mismatched_keys"]:
+            # Clamp all loaded parameters to avoid NaNs due to large values
+            params = list(self.model.model.parameters())
+            if hasattr(torch, "_foreach_clamp_"):
+                # single multi-tensor kernel instead of one launch per parameter
+                torch._foreach_clamp_(params, -1000, 1000)
+            else:
+                for param in params:
+                    param.clamp_(-1000, 1000)
+
+            # Reininit the weights of all layers that have mismatched sizes
+            for key, _, _ in info["mismatched_keys"]:
+                _model = self.model
+                for attr_name in key.split(".")[:-1]:
+                    _model = getattr(_model, attr_name)
+                # replace NaNs in-place and keep the Parameter identity intact
+                _model.weight.data.nan_to_num_(nan=0.001)
+                _model.weight.requires_grad_(True)
+
+        # cache the model-shaped history arrays, _predict reuses them on
+        # every call instead of re-converting the pandas objects
+        self._cache_history(y, X)
 
         if self.validation_split is not None:
             split = int(len(y) * (1 - self.validation_split))
@@ -240,61 +262,95 @@ class HFTransformersForecaster(BaseForecaster):
         )
         trainer.train()
 
+    def _cache_history(self, y, X):
+        """Cache the history arrays in model shape, for reuse in _predict."""
+        self._y_np = np.ascontiguousarray(y.values).reshape(1, -1)
+        # bool mask, 1 byte per element instead of 8 for int64
+        self._past_observed_np = ~np.isnan(self._y_np)
+        if X is not None:
+            self._X_np = np.ascontiguousarray(X.values).reshape(1, -1, X.shape[-1])
+        else:
+            self._X_np = None
+
+    def _update(self, y, X=None, update_params=True):
+        """Update fitted parameters and refresh the cached history arrays.
+
+        The base class extends ``self._y`` and advances the cutoff even when
+        ``update_params=False``, so the model-shaped caches built in ``_fit``
+        must be rebuilt here to track the new history.
+        """
+        super()._update(y, X=X, update_params=update_params)
+        self._cache_history(self._y, self._X)
+        return self
+
+    def _to_device(self, arr, dtype=None):
+        """Move a numpy array to the model device in a single transfer.
+
+        On CUDA devices the array is staged through pinned host memory and
+        copied with non_blocking=True, so the copy can overlap with kernel
+        launches instead of running as a synchronous staged copy.
+        """
+        if self.model.device.type == "cuda":
+            tensor = torch.from_numpy(np.ascontiguousarray(arr))
+            if dtype is not None:
+                tensor = tensor.to(dtype)
+            return tensor.pin_memory().to(self.model.device, non_blocking=True)
+        return torch.as_tensor(arr, dtype=dtype, device=self.model.device)
+
     def _predict(self, fh, X=None):
+        if self.precision is not None:
+            # the setting is process-global and may have been changed by
+            # other code between fit and predict, so re-apply it here
+            torch.set_float32_matmul_precision(self.precision)
+
         if self.deterministic:
             transformers.set_seed(42)
 
         if fh is None:
             fh = self.fh
-        fh = fh.to_relative(self.cutoff)
+        # materialize the relative and absolute horizon index once
+        fh_rel_values = fh.to_relative(self.cutoff)._values
+        fh_abs_values = fh.to_absolute(self.cutoff)._values
 
-        if min(fh._values) < 0:
+        if min(fh_rel_values) < 0:
             raise NotImplementedError(
                 "The huggingface adapter is not supporting insample predictions."
             )
 
         self.model.eval()
-        from torch import from_numpy
 
-        hist = self._y.values.reshape((1, -1))
+        config = self.model.config
+        pred_len = config.prediction_length
+        total_hist = config.context_length + max(config.lags_sequence)
+
+        hist = self._y_np
         if X is not None:
-            hist_x = self._X.values.reshape((1, -1, self._X.shape[-1]))
-            x_ = X.values.reshape((1, -1, self._X.shape[-1]))
-            if x_.shape[1] < self.model.config.prediction_length:
-                # TODO raise exception here?
-                x_ = np.resize(
-                    x_, (1, self.model.config.prediction_length, x_.shape[-1])
-                )
+            hist_x = self._X_np
+            x_ = X.values.reshape((1, -1, self._X_np.shape[-1]))
         else:
-            hist_x = np.array(
-                [
-                    [[]]
-                    * (
-                        self.model.config.context_length
-                        + max(self.model.config.lags_sequence)
-                    )
-                ]
-            )
-            x_ = np.array([[[]] * self.model.config.prediction_length])
-
-        pred = self.model.generate(
-            past_values=from_numpy(hist).to(self.model.dtype).to(self.model.device),
-            past_time_features=from_numpy(
-                hist_x[
-                    :,
-                    -self.model.config.context_length
-                    - max(self.model.config.lags_sequence) :,
-                ]
+            hist_x = np.array([[[]] * total_hist])
+            x_ = np.array([[[]] * pred_len])
+
+        # combine past and future time features into one array so they
+        # cross to the device in a single transfer, then slice views
+        hist_x = hist_x[:, -total_hist:]
+        time_feat = np.concatenate([hist_x, x_], axis=1)
+
+        with torch.inference_mode():
+            time_feat_t = self._to_device(time_feat, dtype=self.model.dtype)
+            past_tf = time_feat_t[:, : hist_x.shape[1]]
+            future_tf = time_feat_t[:, hist_x.shape[1] :]
+            if future_tf.shape[1] < pred_len:
+                # TODO raise exception here?
+                n_reps = -(-pred_len // future_tf.shape[1])
+                future_tf = future_tf.repeat(1, n_reps, 1)[:, :pred_len]
+
+            pred = self.model.generate(
+                past_values=self._to_device(hist, dtype=self.model.dtype),
+                past_time_features=past_tf,
+                future_time_features=future_tf,
+                past_observed_mask=self._to_device(self._past_observed_np),
             )
-            .to(self.model.dtype)
-            .to(self.model.device),
-            future_time_features=from_numpy(x_)
-            .to(self.model.dtype)
-            .to(self.model.device),
-            past_observed_mask=from_numpy((~np.isnan(hist)).astype(int)).to(
-                self.model.device
-            ),
-        )
 
         pred = pred.sequences.mean(dim=1).detach().cpu().numpy().T
 
@@ -306,7 +362,7 @@ class HFTransformersForecaster(BaseForecaster):
             # columns=self._y.columns
             name=self._y.name,
         )
-        return pred.loc[fh.to_absolute(self.cutoff)._values]
+        return pred.loc[fh_abs_values]
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -365,34 +421,53 @@ class PyTorchDataset(Dataset):
     """Dataset for use in sktime deep learning forecasters."""
 
     def __init__(self, y, seq_len, fh=None, X=None):
-        self.y = y.values
-        self.X = X.values if X is not None else X
+        self.y = np.ascontiguousarray(y.values, dtype=np.float32)
+        self.X = (
+            np.ascontiguousarray(X.values, dtype=np.float32) if X is not None else X
+        )
         self.seq_len = seq_len
         self.fh = fh
+        # bool mask, 1 byte per element instead of 8 for int64
+        self._obs = ~np.isnan(self.y)
+        self._len = max(len(self.y) - seq_len - (fh or 0) + 1, 0)
+        self._seq_plus_fh = seq_len + (fh or 0)
+        if self.X is None:
+            # cached zero-column placeholders, shared by every sample
+            from torch import empty
+
+            self._empty_past = empty((seq_len, 0))
+            self._empty_future = empty((fh or 0, 0))
 
     def __len__(self):
         """Return length of dataset."""
-        return max(len(self.y) - self.seq_len - self.fh + 1, 0)
+        return self._len
+
+    def __getitems__(self, indices):
+        """Return a batch of data points.
+
+        Recognized by torch DataLoader from 2.0 on, so a batch is fetched
+        with a single call into the dataset instead of one per sample.
+        """
+        getitem = self.__getitem__
+        return [getitem(int(i)) for i in indices]
 
     def __getitem__(self, i):
         """Return data point."""
-        from torch import from_numpy, tensor
+        from torch import from_numpy
 
-        hist_y = tensor(self.y[i : i + self.seq_len]).float()
+        hist_y = from_numpy(self.y[i : i + self.seq_len])
         if self.X is not None:
-            exog_data = tensor(
-                self.X[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float()
-            hist_exog = tensor(self.X[i : i + self.seq_len]).float()
+            exog_data = from_numpy(self.X[i + self.seq_len : i + self._seq_plus_fh])
+            hist_exog = from_numpy(self.X[i : i + self.seq_len])
         else:
-            exog_data = tensor([[]] * self.fh)
-            hist_exog = tensor([[]] * self.seq_len)
+            exog_data = self._empty_future
+            hist_exog = self._empty_past
         return {
             "past_values": hist_y,
             "past_time_features": hist_exog,
             "future_time_features": exog_data,
-            "past_observed_mask": (~hist_y.isnan()).to(int),
+            "past_observed_mask": from_numpy(self._obs[i : i + self.seq_len]),
             "future_values": from_numpy(
-                self.y[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float(),
+                self.y[i + self.seq_len : i + self._seq_plus_fh]
+            ),
         }
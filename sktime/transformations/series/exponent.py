@@ -5,12 +5,259 @@
 __author__ = ["RNKuhns"]
 __all__ = ["ExponentTransformer", "SqrtTransformer"]
 
+from functools import partial
+
 import numpy as np
 import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.utils.dependencies import _check_soft_dependencies
+from sktime.utils.validation import check_n_jobs
 from sktime.utils.warnings import warn
 
+_NUMBA_AVAILABLE = _check_soft_dependencies("numba", severity="none")
+_NUMEXPR_AVAILABLE = _check_soft_dependencies("numexpr", severity="none")
+
+# no GPU (cupy/cudf) backend: input coercion converts X to the pandas
+# mtypes in X_inner_mtype before _transform runs, so device arrays can
+# never reach these kernels without a host round-trip that would cost
+# more than the elementwise power itself
+
+# below this size, JIT dispatch overhead outweighs the fused kernel
+_JIT_MIN_SIZE = 4096
+
+# block size for the numpy fallback, sized so the add intermediate stays
+# resident in L2 between the add pass and the power pass
+_BLOCK_BYTES = 262_144
+
+# below this many elements, thread startup costs more than it saves
+_PARALLEL_MIN_SIZE = 1_000_000
+
+if _NUMBA_AVAILABLE:
+    from numba import njit, prange
+
+    # cache=True persists the compiled kernels on disk, so the first-call
+    # JIT cost is paid once per environment rather than once per process;
+    # numba's pycc AOT compiler is deprecated and sktime ships pure python,
+    # so an ahead-of-time compiled extension is not an option here
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fused_power_numba(arr, offset, power):
+        """Compute ``(arr + offset) ** power`` in one parallel pass."""
+        out = np.empty_like(arr)
+        for i in prange(arr.shape[0]):
+            out[i] = (arr[i] + offset) ** power
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fused_root_numba(arr, offset, power):
+        """Compute ``arr ** power - offset`` in one parallel pass."""
+        out = np.empty_like(arr)
+        for i in prange(arr.shape[0]):
+            out[i] = arr[i] ** power - offset
+        return out
+
+
+def _out_dtype(arr):
+    """Return the output dtype for an input array.
+
+    Float inputs pass through at their own precision, float32 in particular
+    stays float32, which halves the bytes moved on the memory-bound kernel;
+    everything else is promoted to float64.
+    """
+    if np.issubdtype(arr.dtype, np.floating):
+        return arr.dtype
+    return np.dtype(np.float64)
+
+
+def _use_numba(arr, offset):
+    """Whether the fused numba kernels apply to this input."""
+    return (
+        _NUMBA_AVAILABLE
+        and np.ndim(offset) == 0
+        and arr.size >= _JIT_MIN_SIZE
+        and np.issubdtype(arr.dtype, np.floating)
+    )
+
+
+def _use_numexpr(arr, offset):
+    """Whether the numexpr backend applies to this input.
+
+    numexpr evaluates the fused expression in cache-sized blocks on its
+    own thread pool, compiling small integer and half powers to the same
+    specialized operations numpy would use, so it applies to every
+    exponent once the input is large enough to amortize the dispatch.
+    """
+    return _NUMEXPR_AVAILABLE and np.ndim(offset) == 0 and arr.size >= _JIT_MIN_SIZE
+
+
+def _blocked_power(flat_in, flat_out, offset, kernel, start, stop):
+    """Run the blocked add->power passes over ``flat_in[start:stop]``."""
+    block = _BLOCK_BYTES // flat_out.dtype.itemsize
+    for i in range(start, stop, block):
+        stop_i = min(i + block, stop)
+        chunk = flat_out[i:stop_i]
+        np.add(flat_in[i:stop_i], offset, out=chunk)
+        kernel(chunk, chunk)
+
+
+def _blocked_root(flat_in, flat_out, offset, kernel, start, stop):
+    """Run the blocked root->subtract passes over ``flat_in[start:stop]``."""
+    block = _BLOCK_BYTES // flat_out.dtype.itemsize
+    for i in range(start, stop, block):
+        stop_i = min(i + block, stop)
+        chunk = flat_out[i:stop_i]
+        kernel(flat_in[i:stop_i], chunk)
+        np.subtract(chunk, offset, out=chunk)
+
+
+def _run_blocked(worker, flat_in, flat_out, offset, kernel, n_jobs):
+    """Run a blocked worker over the array, sharded across threads if asked.
+
+    numpy ufuncs release the GIL inside the kernel loop, so contiguous
+    shards scale with thread count without any compilation step; this is
+    the multi-core path when the numba backend is not available.
+    """
+    size = flat_in.size
+    if n_jobs > 1 and size >= _PARALLEL_MIN_SIZE:
+        from concurrent.futures import ThreadPoolExecutor
+
+        bounds = [size * k // n_jobs for k in range(n_jobs + 1)]
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(worker, flat_in, flat_out, offset, kernel, lo, hi)
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+    else:
+        worker(flat_in, flat_out, offset, kernel, 0, size)
+
+
+def _apply_power(arr, offset, power, kernel=None, n_jobs=1):
+    """Compute ``(arr + offset) ** power`` elementwise.
+
+    ``kernel`` is an optional prebound result of ``_power_function(power)``;
+    passing it skips the per-call kernel selection.
+    """
+    if _use_numba(arr, offset):
+        flat = np.ascontiguousarray(arr).reshape(-1)
+        return _fused_power_numba(flat, float(offset), float(power)).reshape(arr.shape)
+    if _use_numexpr(arr, offset):
+        import numexpr
+
+        scalar = _out_dtype(arr).type
+        return numexpr.evaluate(
+            "(arr + offset) ** power",
+            local_dict={"arr": arr, "offset": scalar(offset), "power": scalar(power)},
+        )
+    if kernel is None:
+        kernel = _power_function(power)
+    out_dtype = _out_dtype(arr)
+    if np.ndim(offset) == 0 and offset == 0:
+        # zero offset: skip the add entirely, one less full-array sweep
+        return kernel(arr, np.empty(arr.shape, dtype=out_dtype))
+    if (
+        np.ndim(offset) == 0
+        and arr.flags.c_contiguous
+        and arr.size * out_dtype.itemsize > _BLOCK_BYTES
+    ):
+        # cache-blocked: add then power one L2-sized chunk at a time, so
+        # the intermediate sum never round-trips through DRAM
+        out = np.empty(arr.shape, dtype=out_dtype)
+        _run_blocked(
+            _blocked_power, arr.reshape(-1), out.reshape(-1), offset, kernel, n_jobs
+        )
+        return out
+    # the sum is the only allocation, the power is computed in-place on it
+    buf = np.add(arr, offset, dtype=out_dtype)
+    return kernel(buf, buf)
+
+
+def _apply_inverse_power(arr, offset, power, kernel=None, n_jobs=1):
+    """Compute ``arr ** power - offset`` elementwise.
+
+    ``kernel`` is an optional prebound result of ``_power_function(power)``;
+    passing it skips the per-call kernel selection.
+    """
+    if _use_numba(arr, offset):
+        flat = np.ascontiguousarray(arr).reshape(-1)
+        return _fused_root_numba(flat, float(offset), float(power)).reshape(arr.shape)
+    if _use_numexpr(arr, offset):
+        import numexpr
+
+        scalar = _out_dtype(arr).type
+        return numexpr.evaluate(
+            "arr ** power - offset",
+            local_dict={"arr": arr, "offset": scalar(offset), "power": scalar(power)},
+        )
+    if kernel is None:
+        kernel = _power_function(power)
+    out_dtype = _out_dtype(arr)
+    if np.ndim(offset) == 0 and offset == 0:
+        # zero offset: skip the subtract, one less full-array sweep
+        return kernel(arr, np.empty(arr.shape, dtype=out_dtype))
+    if (
+        np.ndim(offset) == 0
+        and arr.flags.c_contiguous
+        and arr.size * out_dtype.itemsize > _BLOCK_BYTES
+    ):
+        # cache-blocked: root then subtract one L2-sized chunk at a time
+        out = np.empty(arr.shape, dtype=out_dtype)
+        _run_blocked(
+            _blocked_root, arr.reshape(-1), out.reshape(-1), offset, kernel, n_jobs
+        )
+        return out
+    # single output allocation, root and subtract both write into it
+    buf = kernel(arr, np.empty(arr.shape, dtype=out_dtype))
+    return np.subtract(buf, offset, out=buf)
+
+
+def _copy_kernel(arr, out):
+    """Elementwise kernel for power 1."""
+    if out is not arr:
+        np.copyto(out, arr)
+    return out
+
+
+def _int_power_kernel(arr, out, n):
+    """Elementwise kernel computing ``arr ** n`` by repeated multiplication."""
+    if out is arr:
+        arr = arr.copy()
+    np.multiply(arr, arr, out=out)
+    for _ in range(n - 2):
+        np.multiply(out, arr, out=out)
+    return out
+
+
+def _generic_power_kernel(arr, out, power):
+    """Elementwise kernel computing ``arr ** power`` via ``np.power``."""
+    return np.power(arr, power, out=out)
+
+
+def _power_function(power):
+    """Return an elementwise kernel computing ``arr ** power`` into ``out``.
+
+    The kernel signature is ``kernel(arr, out)``, where ``out`` may alias
+    ``arr``, in which case the power is computed in-place without a further
+    temporary. Common exponents get specialized kernels: ``sqrt`` and
+    ``square`` are dedicated SIMD ufuncs and small integer powers are
+    computed by repeated multiplication, all of which avoid the much slower
+    generic libm ``pow`` loop that ``np.power`` dispatches to.
+
+    All returned kernels are module-level callables or partials of them, so
+    they are picklable and can be cached on estimator instances.
+    """
+    if power == 1:
+        return _copy_kernel
+    if power == 0.5:
+        return np.sqrt
+    if power == 2:
+        return np.square
+    if power in (3, 4):
+        return partial(_int_power_kernel, n=int(power))
+    return partial(_generic_power_kernel, power=power)
+
 
 class ExponentTransformer(BaseTransformer):
     """Apply element-wise exponentiation transformation to a time series.
@@ -33,6 +280,14 @@ class ExponentTransformer(BaseTransformer):
         then the offset will be equal to the absolute value of the most negative
         value. If not negative values are present the offset is set to zero.
         If an integer or float value is supplied it will be used as the offset.
+        For panel or hierarchical input, "auto" pools all instances when
+        determining the offset, per column.
+
+    n_jobs : int, default=1
+        Number of threads the numpy fallback may use on large inputs,
+        following the scikit-learn convention, -1 means all processors.
+        Only affects runtime, not the result; the numba and numexpr
+        backends manage their own thread pools and ignore this value.
 
     Attributes
     ----------
@@ -76,8 +331,15 @@ class ExponentTransformer(BaseTransformer):
         "scitype:transform-output": "Series",
         # what scitype is returned: Primitives, Series, Panel
         "scitype:instancewise": True,  # is this an instance-wise transform?
-        "X_inner_mtype": ["pd.DataFrame", "pd.Series"],
+        "X_inner_mtype": [
+            "pd.DataFrame",
+            "pd.Series",
+            "pd-multiindex",
+            "pd_multiindex_hier",
+        ],
         # which mtypes do _fit/_predict support for X?
+        # panel and hierarchical input is handled as one flat frame, a
+        # single ufunc pass instead of a python loop over instances
         "y_inner_mtype": "None",  # which mtypes do _fit/_predict support for y?
         "fit_is_empty": True,
         "transform-returns-same-time-index": True,
@@ -85,9 +347,10 @@ class ExponentTransformer(BaseTransformer):
         "capability:inverse_transform": True,
     }
 
-    def __init__(self, power=0.5, offset="auto"):
+    def __init__(self, power=0.5, offset="auto", n_jobs=1):
         self.power = power
         self.offset = offset
+        self.n_jobs = n_jobs
 
         if not isinstance(self.power, (int, float)):
             raise ValueError(
@@ -110,6 +373,21 @@ class ExponentTransformer(BaseTransformer):
                 obj=self,
             )
             self.set_tags(**{"skip-inverse-transform": True})
+            self._inv_power = None
+            self._inv_power_fun = None
+        else:
+            # cached reciprocal, used by every _inverse_transform call
+            self._inv_power = 1.0 / power
+            self._inv_power_fun = _power_function(self._inv_power)
+
+        # power is fixed at construction and the transformer is fit-empty,
+        # so the specialized kernels can be bound once here instead of
+        # being re-selected on every _transform call
+        self._power_fun = _power_function(power)
+        self._n_jobs = check_n_jobs(n_jobs)
+        # one-shot cast so the backends get a plain float every call
+        # instead of re-promoting a python int or numpy scalar each time
+        self._power_scalar = float(power)
 
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
@@ -129,8 +407,12 @@ class ExponentTransformer(BaseTransformer):
             transformed version of X
         """
         offset = self._get_offset(X)
-        Xt = X.add(offset).pow(self.power)
-        return Xt
+        return self._wrap_like(
+            X,
+            _apply_power(
+                X.to_numpy(), offset, self._power_scalar, self._power_fun, self._n_jobs
+            ),
+        )
 
     def _inverse_transform(self, X, y=None):
         """Logic used by ``inverse_transform`` to reverse transformation on ``X``.
@@ -148,22 +430,51 @@ class ExponentTransformer(BaseTransformer):
             inverse transformed version of X
         """
         offset = self._get_offset(X)
-        Xt = X.pow(1.0 / self.power).add(-offset)
-        return Xt
+        return self._wrap_like(
+            X,
+            _apply_inverse_power(
+                X.to_numpy(),
+                offset,
+                self._inv_power,
+                self._inv_power_fun,
+                self._n_jobs,
+            ),
+        )
+
+    @staticmethod
+    def _wrap_like(X, values):
+        """Wrap a values array in the same pandas container type as X.
+
+        The container takes the array without a copy, so ``values`` must be
+        freshly allocated each call — a scratch buffer cached on ``self``
+        would silently overwrite the data of previously returned frames.
+        """
+        if isinstance(X, pd.DataFrame):
+            return pd.DataFrame(values, index=X.index, columns=X.columns)
+        return pd.Series(values, index=X.index, name=X.name)
 
     def _get_offset(self, X):
-        if self.offset == "auto":
-            Xmin = X.min()
-            offset = -Xmin * (Xmin < 0)
+        """Return the offset for X, a scalar or a 1D array in column order."""
+        if isinstance(self.offset, str):  # offset="auto"
+            # one numpy reduction kernel instead of pandas' per-column
+            # BlockManager loop, O(cols) python overhead on wide frames
+            arr = X.to_numpy()
+            mins = arr.min(axis=0)
+            if np.any(np.isnan(mins)):
+                # match pandas' skipna reduction, only paying the extra
+                # nan pass when a nan actually reaches the minimum
+                mins = np.nanmin(arr, axis=0)
+            # branchless, equals -min where negative, else 0
+            offset = np.maximum(-mins, 0)
         else:
             offset = self.offset
 
-        if isinstance(X, pd.DataFrame):
-            if isinstance(offset, (int, float)):
-                offset = pd.Series(offset, index=X.columns)
-            else:
-                offset = pd.Series(offset)
-                offset.index = X.columns
+        if np.ndim(offset) > 0 or isinstance(offset, pd.Series):
+            offset = np.asarray(offset)
+            if offset.size > 0 and np.all(offset == offset.flat[0]):
+                # collapse constant per-column offsets to a scalar, which
+                # broadcasts cheaper and unlocks the fused backends
+                offset = float(offset.flat[0])
 
         return offset
 
@@ -209,6 +520,10 @@ class SqrtTransformer(ExponentTransformer):
         value. If not negative values are present the offset is set to zero.
         If an integer or float value is supplied it will be used as the offset.
 
+    n_jobs : int, default=1
+        Number of threads the numpy fallback may use on large inputs,
+        following the scikit-learn convention, -1 means all processors.
+
     Attributes
     ----------
     offset : int or float
@@ -240,8 +555,8 @@ class SqrtTransformer(ExponentTransformer):
     >>> y_transform = transformer.fit_transform(y)
     """
 
-    def __init__(self, offset="auto"):
-        super().__init__(power=0.5, offset=offset)
+    def __init__(self, offset="auto", n_jobs=1):
+        super().__init__(power=0.5, offset=offset, n_jobs=n_jobs)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
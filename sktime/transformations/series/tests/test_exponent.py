@@ -46,3 +46,22 @@ def test_wrong_power_type_raises_error(power_transformer, _power):
     with pytest.raises(ValueError, match=match):
         transformer = power_transformer(power=_power)
         transformer.fit(y)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(power_transformers),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_sqrt_uses_sqrt_kernel():
+    """SqrtTransformer should bind np.sqrt/np.square, not the generic pow."""
+    import numpy as np
+
+    y = _make_series(n_timepoints=75)
+
+    transformer = SqrtTransformer(offset=1.0)
+    assert transformer._power_fun is np.sqrt
+    assert transformer._inv_power_fun is np.square
+
+    yt = transformer.fit_transform(y)
+    np.testing.assert_allclose(yt, np.sqrt(y + 1.0))
+    np.testing.assert_allclose(transformer.inverse_transform(yt), y)